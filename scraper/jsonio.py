@@ -0,0 +1,52 @@
+"""
+JSON file I/O for the scraper orchestrators
+"""
+
+import os
+
+import orjson
+
+def load_json(path):
+    """Read and decode a JSON file"""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+def save_json(data, *paths) -> None:
+    """Write data as UTF-8 JSON indented by two spaces to each path"""
+    # Byte-for-byte what json.dump(..., indent=2, ensure_ascii=False) wrote;
+    # encoded once however many copies are written
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    for path in paths:
+        # Skip the write when the file is already up to date
+        if _holds(path, payload):
+            continue
+        with open(path, 'wb') as f:
+            f.write(payload)
+
+def append_ndjson(records, path, max_bytes=None) -> None:
+    """Append records to a newline-delimited JSON file, one object per line"""
+    # Only the new lines are encoded and written; earlier lines are never touched
+    with open(path, 'ab') as f:
+        f.write(b''.join(orjson.dumps(record) + b'\n' for record in records))
+    if max_bytes is not None and os.stat(path).st_size > max_bytes:
+        _trim_ndjson(path, max_bytes // 2)
+
+def _trim_ndjson(path, keep_bytes: int) -> None:
+    """Drop the oldest lines of an NDJSON file so at most keep_bytes remain"""
+    # Trimming to half the cap means the rewrite happens once per many appends
+    with open(path, 'rb') as f:
+        data = f.read()
+    cut = data.find(b'\n', len(data) - keep_bytes - 1) + 1
+    with open(path, 'wb') as f:
+        f.write(data[cut:])
+
+def _holds(path, payload: bytes) -> bool:
+    """Check whether a file already contains exactly payload"""
+    # A size mismatch, the common case for changed data, needs only a stat
+    try:
+        if os.stat(path).st_size != len(payload):
+            return False
+        with open(path, 'rb') as f:
+            return f.read() == payload
+    except FileNotFoundError:
+        return False
@@ -0,0 +1,136 @@
+"""Config-driven scraper for provider pages that list fiber plans as cards"""
+import logging
+from typing import List, Dict, Any, Optional
+
+from lxml import etree
+
+from _html import fetch_tree, select_one
+from _parsers import extract_speed, extract_price, extract_contract_length, field_lines
+
+logger = logging.getLogger(__name__)
+
+# Elements and text nodes matched inside libxml2 through the EXSLT regular-expression extension
+_REGEXP_NS = {'re': 'http://exslt.org/regular-expressions'}
+_SECTION_XPATH = etree.XPath(
+    r"//*[self::div or self::section][re:test(@class, 'plan|package|price|card|product', 'i')]", namespaces=_REGEXP_NS
+)
+_NAME_XPATH = etree.XPath(
+    r"descendant::*[self::h2 or self::h3 or self::h4 or self::span][re:test(@class, 'title|name|plan', 'i')]", namespaces=_REGEXP_NS
+)
+_FIBER_TEXT_XPATH = etree.XPath(
+    r"//text()[re:test(., 'fiber.*\d+\s*(mbit|mb)', 'i')]", namespaces=_REGEXP_NS
+)
+_PRICE_TEXT_XPATH = etree.XPath(
+    r".//text()[re:test(., '\d+\s*(kr|dkk)', 'i')]", namespaces=_REGEXP_NS
+)
+# Visible text nodes of a subtree, in document order
+_STRINGS_XPATH = etree.XPath("descendant::text()[not(parent::script or parent::style)]")
+
+def _stripped_strings(element) -> List[str]:
+    """Return the non-empty, stripped text nodes under an element"""
+    return [s for s in (t.strip() for t in _STRINGS_XPATH(element)) if s]
+
+def make_fiber_config(name: str, url: str, features, rating: float, contract: int = 12, promotion: str = '', text_search: bool = False) -> Dict[str, Any]:
+    """Build a provider config for scrape_generic_fiber"""
+    return {
+        'name': name,
+        'url': url,
+        'features': tuple(features),
+        'rating': rating,
+        # Used when a card doesn't state a contract length or promotion
+        'contract': contract,
+        'promotion': promotion,
+        # Fall back to searching page text for "fiber ... N mbit" when no card matches
+        'text_search': text_search
+    }
+
+def _parse_fiber_section(cfg: Dict[str, Any], section) -> Optional[Dict[str, Any]]:
+    """Parse a single fiber plan section"""
+    try:
+        # Extract plan name
+        plan_name = ""
+        name_elem = select_one(_NAME_XPATH, section)
+        if name_elem is not None:
+            plan_name = ''.join(_stripped_strings(name_elem))
+        
+        # One walk over the section's text nodes
+        fields = field_lines(_stripped_strings(section))
+        
+        speed = extract_speed(fields.get('speed'))
+        price = extract_price(fields.get('price'))
+        contract = extract_contract_length(fields.get('contract')) if 'contract' in fields else cfg['contract']
+        promotion = fields.get('promo', cfg['promotion'])
+        
+        if speed > 0 and price > 0:
+            return {
+                'udbyder': cfg['name'],
+                'hastighed_mbit': speed,
+                'pris_mdr': price,
+                'bindingstid_mdr': contract,
+                'kampagne': promotion,
+                'plan_navn': plan_name or f"{cfg['name']} Fiber {speed}",
+                'beskrivelse': f"{cfg['name']} Fiber {speed} Mbit/s",
+                'features': list(cfg['features']),
+                'rating': cfg['rating']
+            }
+    except Exception as e:
+        logger.warning("Error parsing %s plan section: %s", cfg['name'], e)
+    
+    return None
+
+def _search_fiber_text(cfg: Dict[str, Any], tree) -> List[Dict[str, Any]]:
+    """Find plans from "fiber ... N mbit" text with a price in the same container"""
+    plans = []
+    
+    for plan_text in _FIBER_TEXT_XPATH(tree):
+        try:
+            # Tail text belongs to the element enclosing its owner
+            parent = plan_text.getparent()
+            if plan_text.is_tail and parent is not None:
+                parent = parent.getparent()
+            if parent is not None:
+                # Look for price in the same container
+                price_elem = next(iter(_PRICE_TEXT_XPATH(parent)), None)
+                if price_elem:
+                    speed = extract_speed(str(plan_text))  # plain str, so the cache doesn't pin the tree
+                    price = extract_price(price_elem.strip())
+                    
+                    if speed > 0 and price > 0:
+                        plans.append({
+                            'udbyder': cfg['name'],
+                            'hastighed_mbit': speed,
+                            'pris_mdr': price,
+                            'bindingstid_mdr': cfg['contract'],
+                            'kampagne': cfg['promotion'],
+                            'plan_navn': f"{cfg['name']} Fiber {speed}",
+                            'beskrivelse': f"{cfg['name']} Fiber {speed} Mbit/s",
+                            'features': list(cfg['features'][:1]),
+                            'rating': cfg['rating']
+                        })
+        except Exception as e:
+            logger.warning("Error parsing %s plan text: %s", cfg['name'], e)
+    
+    return plans
+
+def scrape_generic_fiber(cfg: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Scrape a provider's fiber plans as described by its config"""
+    plans = []
+    
+    try:
+        tree = fetch_tree(cfg['url'])
+        
+        # Look for plan cards or pricing sections
+        plan_sections = _SECTION_XPATH(tree)
+        
+        plans = [p for p in (_parse_fiber_section(cfg, s) for s in plan_sections) if p]
+        
+        # Alternative approach: look for plan patterns in the page text
+        if not plans and cfg['text_search']:
+            plans = _search_fiber_text(cfg, tree)
+        
+        logger.info("Scraped %d plans from %s", len(plans), cfg['name'])
+    
+    except Exception as e:
+        logger.error("Error scraping %s: %s", cfg['name'], e)
+    
+    return plans
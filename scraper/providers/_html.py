@@ -0,0 +1,43 @@
+"""HTML parsing helpers shared by the provider scrapers"""
+from functools import lru_cache
+
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+
+from _http import REQUEST_TIMEOUT, iter_page
+
+def parse_html(body: bytes):
+    """Parse a page body into an lxml element tree"""
+    # Provider sites are served as UTF-8; declaring it skips encoding detection.
+    # Parsers are not shared between threads, so build one per page.
+    parser = lxml_html.HTMLParser(encoding='utf-8')
+    return lxml_html.fromstring(body, parser=parser)
+
+@lru_cache(maxsize=256)
+def css(selector: str) -> CSSSelector:
+    """Compile a CSS selector, sharing one compiled XPath per selector string"""
+    return CSSSelector(selector)
+
+def select_one(selector, element):
+    """Return the first element matched by a compiled selector, or None"""
+    matches = selector(element)
+    return matches[0] if matches else None
+
+def select_first(selectors, element):
+    """Return the first element matched by the earliest selector that matches anything, or None"""
+    # A comma-joined selector returns matches in document order; this keeps
+    # the selectors' order of preference instead
+    for selector in selectors:
+        matches = selector(element)
+        if matches:
+            return matches[0]
+    return None
+
+def fetch_tree(url: str, timeout=REQUEST_TIMEOUT):
+    """Fetch a page and parse it as the body streams in"""
+    # Feeding chunks straight into libxml2 avoids holding the whole body in
+    # memory next to the tree
+    parser = lxml_html.HTMLParser(encoding='utf-8')
+    for chunk in iter_page(url, timeout):
+        parser.feed(chunk)
+    return parser.close()
@@ -0,0 +1,75 @@
+"""Shared HTTP session for the provider scrapers"""
+import logging
+import os
+import time
+from typing import Iterator
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+def _env_seconds(name: str, default: int) -> int:
+    """Read a whole number of seconds from the environment, falling back to default"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning("Ignoring %s=%r, not a whole number of seconds; using %ss", name, value, default)
+        return default
+
+# Set SCRAPER_HTTP_CACHE to a cache name to replay provider pages from a local
+# cache during development instead of fetching them on every run. Stale pages
+# are revalidated with their ETag/Last-Modified, so unchanged pages come back
+# as a bodiless 304. Cached pages are reused without a request for
+# SCRAPER_HTTP_CACHE_TTL seconds; FORCE_UPDATE runs always go to the network.
+HTTP_CACHE = os.getenv('SCRAPER_HTTP_CACHE') if os.getenv('FORCE_UPDATE', 'false').lower() != 'true' else None
+HTTP_CACHE_TTL = _env_seconds('SCRAPER_HTTP_CACHE_TTL', 3600)
+
+# One pooled session so repeated requests reuse TCP/TLS connections
+if HTTP_CACHE:
+    import requests_cache
+    SESSION = requests_cache.CachedSession(HTTP_CACHE, expire_after=HTTP_CACHE_TTL, cache_control=True, allowable_codes=(200,))
+else:
+    SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': USER_AGENT})
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3)
+))
+
+# Pages are read up to this size; anything beyond is inlined JS/CSS noise
+MAX_BODY_BYTES = 2_000_000
+
+# (connect, read) timeouts for each attempt. With two retries the headers
+# arrive within about 46s, and the body is abandoned PAGE_DEADLINE seconds
+# after the request started, so a slow host fails inside runner.BATCH_TIMEOUT
+# and its provider still gets to use its fallback data
+REQUEST_TIMEOUT = (5, 10)
+PAGE_DEADLINE = 40
+
+def iter_page(url: str, timeout=REQUEST_TIMEOUT) -> Iterator[bytes]:
+    """Yield a page body in chunks as it arrives, stopping after MAX_BODY_BYTES"""
+    deadline = time.monotonic() + PAGE_DEADLINE
+    with SESSION.get(url, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        remaining = MAX_BODY_BYTES
+        for chunk in response.iter_content(65536):
+            # The read timeout applies per chunk, so a host trickling bytes
+            # could otherwise hold the page open indefinitely
+            if time.monotonic() > deadline:
+                raise requests.Timeout(f"{url} took longer than {PAGE_DEADLINE}s")
+            yield chunk[:remaining]
+            remaining -= len(chunk)
+            if remaining <= 0:
+                break
+
+def fetch_page(url: str, timeout=REQUEST_TIMEOUT) -> bytes:
+    """Fetch a page body, reading at most MAX_BODY_BYTES"""
+    return b''.join(iter_page(url, timeout))
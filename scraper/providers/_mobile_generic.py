@@ -0,0 +1,115 @@
+"""Config-driven scraper for provider pages that list mobile plans as cards"""
+import logging
+from dataclasses import asdict
+from typing import List, Dict, Any, Optional
+
+from _html import css, fetch_tree, select_first, select_one
+from _models import MobilPlan
+from _parsers import KeywordScanner, first_match, parse_amount, parse_data_gb
+
+logger = logging.getLogger(__name__)
+
+# Selectors compile to XPath once per process, shared by every provider, and run inside libxml2
+_CONTAINER_SEL = css('div.plan-card, div.subscription-card, div.mobile-plan')
+# Headings name a card; the name classes are only a fallback
+_NAME_SELS = (css('h3, h4'), css('.plan-name, .subscription-name'))
+_PRICE_SEL = css('.price, .monthly-price, .cost')
+_DATA_SEL = css('.data, .gb, .data-amount')
+
+# Contract keywords checked in order; the first needle found wins.
+# Providers that state contract lengths on their cards pass their own table.
+_CONTRACT_MAP = (
+    ('ingen binding', 0),
+)
+
+def make_mobile_config(name: str, url: str, promo_map, fallback, family_words=(), family_label: str = 'Nej', contract_map=_CONTRACT_MAP) -> Dict[str, Any]:
+    """Build a provider config for scrape_generic_mobile"""
+    return {
+        'name': name,
+        'url': url,
+        'promo_map': promo_map,
+        'contract_map': contract_map,
+        'family_words': frozenset(family_words),
+        'family_label': family_label,
+        'fallback': fallback,
+        # Table needles plus the roaming/family words, matched in one pass over the container text
+        'keywords': KeywordScanner(
+            [needle for table in (contract_map, promo_map) for needle, _ in table] + ['europa', *family_words]
+        )
+    }
+
+def _parse_mobile_container(cfg: Dict[str, Any], container) -> Optional[MobilPlan]:
+    """Parse a single mobile plan container"""
+    try:
+        # Extract plan details
+        name_elem = select_first(_NAME_SELS, container)
+        price_elem = select_one(_PRICE_SEL, container)
+        data_elem = select_one(_DATA_SEL, container)
+        
+        if name_elem is not None and price_elem is not None:
+            price_text = price_elem.text_content().strip()
+            data_text = data_elem.text_content().strip() if data_elem is not None else "Unlimited"
+            
+            # Parse price
+            price = parse_amount(price_text)
+            
+            # Parse data
+            data_gb = parse_data_gb(data_text)
+            
+            # Read the container text once for all keyword checks
+            contract_text = container.text_content()
+            keyword_hits = cfg['keywords'].scan(contract_text.casefold())
+            
+            # Check for EU roaming
+            roaming_eu = 'EU' in contract_text or 'europa' in keyword_hits
+            
+            # Check for family discount
+            family_discount = not cfg['family_words'].isdisjoint(keyword_hits)
+            
+            # Check for contract length
+            contract_months = first_match(cfg['contract_map'], keyword_hits, 0)
+            
+            # Check for promotions
+            promotion = first_match(cfg['promo_map'], keyword_hits, '')
+            
+            plan = MobilPlan(
+                id=0,
+                udbyder=cfg['name'],
+                data_GB=data_gb,
+                pris_mdr=price,
+                roaming_EU=roaming_eu,
+                familierabat=cfg['family_label'] if family_discount else 'Nej',
+                bindingstid_mdr=contract_months,
+                kampagne=promotion,
+                cta_url=cfg['url']
+            )
+            
+            return plan
+    except Exception as e:
+        logger.warning("Error parsing %s plan: %s", cfg['name'], e)
+    
+    return None
+
+def scrape_generic_mobile(cfg: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Scrape a provider's mobile plans as described by its config"""
+    plans = []
+    
+    try:
+        tree = fetch_tree(cfg['url'])
+        
+        # Find mobile plan containers
+        plan_containers = _CONTAINER_SEL(tree)
+        
+        records = [p for p in (_parse_mobile_container(cfg, c) for c in plan_containers) if p]
+        for i, plan in enumerate(records, 1):
+            plan.id = i
+        
+        plans = [asdict(p) for p in records]
+    
+    except Exception as e:
+        logger.error("Error scraping %s mobile: %s", cfg['name'], e)
+        # Return fallback data
+        plans = [asdict(p) for p in cfg['fallback']]
+    
+    logger.info("Scraped %d %s mobile plans", len(plans), cfg['name'])
+    return plans
@@ -0,0 +1,32 @@
+"""Typed records built by the provider scrapers"""
+from dataclasses import dataclass
+
+# Slots are declared by hand: dataclass(slots=True) needs Python 3.10 and
+# the TV workflow still runs 3.9. Fields have no defaults, so the two don't clash.
+@dataclass
+class TvPackage:
+    """A TV package as stored in tv.json"""
+    __slots__ = ('id', 'udbyder', 'pakke_navn', 'kanaler', 'pris_mdr', 'bindingstid_mdr', 'kampagne', 'kategori', 'cta_url')
+    id: int
+    udbyder: str
+    pakke_navn: str
+    kanaler: int
+    pris_mdr: int
+    bindingstid_mdr: int
+    kampagne: str
+    kategori: str
+    cta_url: str
+
+@dataclass
+class MobilPlan:
+    """A mobile plan as stored in mobil.json"""
+    __slots__ = ('id', 'udbyder', 'data_GB', 'pris_mdr', 'roaming_EU', 'familierabat', 'bindingstid_mdr', 'kampagne', 'cta_url')
+    id: int
+    udbyder: str
+    data_GB: int
+    pris_mdr: int
+    roaming_EU: bool
+    familierabat: str
+    bindingstid_mdr: int
+    kampagne: str
+    cta_url: str
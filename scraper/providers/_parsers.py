@@ -0,0 +1,73 @@
+"""Text extraction helpers shared by the provider scrapers"""
+import re
+from functools import lru_cache
+
+from _regex import GBIT_RE, MBIT_RE, PRICE_RE, MONTH_RE, YEAR_RE, AMOUNT_RE, FIELDS_RE, DATA_UNIT_RE
+
+@lru_cache(maxsize=1024)
+def extract_speed(text):
+    if not text: return 0
+    gbit_match = GBIT_RE.search(text)
+    if gbit_match: return int(gbit_match.group(1)) * 1000
+    mbit_match = MBIT_RE.search(text)
+    if mbit_match: return int(mbit_match.group(1))
+    return 0
+
+@lru_cache(maxsize=1024)
+def extract_price(text):
+    if not text: return 0
+    price_match = PRICE_RE.search(text.replace(' ', '').replace(',', '.'))
+    if price_match: return int(price_match.group(1))
+    return 0
+
+@lru_cache(maxsize=1024)
+def extract_contract_length(text):
+    if not text: return 0
+    month_match = MONTH_RE.search(text)
+    if month_match: return int(month_match.group(1))
+    year_match = YEAR_RE.search(text)
+    if year_match: return int(year_match.group(1)) * 12
+    return 0
+
+def parse_amount(text):
+    if not text: return 0
+    amount_match = AMOUNT_RE.search(text)
+    if amount_match: return int(amount_match.group().replace('.', ''))
+    return 0
+
+def parse_data_gb(text):
+    # One pass for every unit marker; a GB figure wins over unlimited
+    units = {m.group().lower() for m in DATA_UNIT_RE.finditer(text)}
+    if 'gb' in units: return parse_amount(text)
+    if units: return 999
+    return 0
+
+def field_lines(strings):
+    # Map each FIELDS_RE group to the first text node that holds it. Nodes are
+    # matched one at a time so a number and a unit in separate elements
+    # (<b>1000</b><span>Mbit/s</span>) never combine into a field.
+    fields = {}
+    for text in strings:
+        for match in FIELDS_RE.finditer(text):
+            fields.setdefault(match.lastgroup, text)
+    return fields
+
+def first_match(table, text, default):
+    return next((value for needle, value in table if needle in text), default)
+
+class KeywordScanner:
+    """Finds every keyword present in a text with a single regex pass"""
+
+    def __init__(self, keywords):
+        keywords = sorted(set(keywords), key=len, reverse=True)
+        # The lookahead is zero-width, so every start position is tried and
+        # overlapping keywords are reported. At each position the longest
+        # keyword wins; shorter keywords inside it come from _implied.
+        self._pattern = re.compile('(?=(%s))' % '|'.join(map(re.escape, keywords)))
+        self._implied = {kw: frozenset(k for k in keywords if k in kw) for kw in keywords}
+
+    def scan(self, text):
+        hits = set()
+        for match in self._pattern.finditer(text):
+            hits |= self._implied[match.group(1)]
+        return hits
@@ -0,0 +1,22 @@
+"""Compiled regular expressions shared by the provider scrapers"""
+import re
+
+GBIT_RE = re.compile(r'(\d+)\s*(gbit|gb)', re.I)
+MBIT_RE = re.compile(r'(\d+)\s*(mbit|mb)', re.I)
+PRICE_RE = re.compile(r'(\d+)')
+MONTH_RE = re.compile(r'(\d+)\s*(måned|mdr)', re.I)
+YEAR_RE = re.compile(r'(\d+)\s*år', re.I)
+SECTION_RE = re.compile(r'plan|package|price|card|product|offer', re.I)
+# First whole number, allowing Danish '.' thousands separators (1.299 kr)
+AMOUNT_RE = re.compile(r'\d+(?:\.\d{3})*')
+DIGIT_RE = re.compile(r'\d')
+# Mobile data allowance markers: a GB figure or an unlimited plan
+DATA_UNIT_RE = re.compile(r'gb|unlimited|ubegrænset', re.I)
+# Speed, price, contract and promotion markers, found in one pass over a card's text
+FIELDS_RE = re.compile(
+    r'(?P<speed>\d+\s*(?:mbit|mb|gb|gbit))'
+    r'|(?P<price>\d+\s*(?:kr|dkk))'
+    r'|(?P<contract>\d+\s*(?:måned|mdr|år))'
+    r'|(?P<promo>gratis|rabat|tilbud|kampagne)',
+    re.I
+)
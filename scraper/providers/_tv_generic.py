@@ -0,0 +1,120 @@
+"""Config-driven scraper for provider pages that list TV packages as cards"""
+import logging
+from dataclasses import asdict
+from typing import List, Dict, Any, Optional
+
+from _html import css, fetch_tree, select_first, select_one
+from _models import TvPackage
+from _parsers import KeywordScanner, first_match, parse_amount
+
+logger = logging.getLogger(__name__)
+
+# Selectors compile to XPath once per process, shared by every provider, and run inside libxml2
+_CONTAINER_SEL = css('div.package-card, div.tv-package, div.subscription-card')
+# Headings name a card; the name classes are only a fallback
+_NAME_SELS = (css('h3, h4'), css('.package-name, .tv-package-name'))
+_PRICE_SEL = css('.price, .monthly-price, .cost')
+_CHANNELS_SEL = css('.channels, .kanaler, .channel-count')
+
+# Keyword tables checked in order; the first needle found wins.
+# Providers with other contract lengths pass their own contract table.
+_CONTRACT_MAP = (
+    ('ingen binding', 0),
+    ('12 måneder', 12),
+    ('24 måneder', 24)
+)
+_CATEGORY_MAP = (
+    ('sport', 'Sport'),
+    ('basis', 'Basis'),
+    ('grund', 'Basis'),
+    ('total', 'All Inclusive'),
+    ('komplet', 'All Inclusive')
+)
+
+def make_tv_config(name: str, url: str, promo_map, fallback, channels: int = 40, contract: int = 6, contract_map=_CONTRACT_MAP) -> Dict[str, Any]:
+    """Build a provider config for scrape_generic_tv"""
+    return {
+        'name': name,
+        'url': url,
+        'promo_map': promo_map,
+        'contract_map': contract_map,
+        # Used when a card doesn't state its channel count or contract length
+        'channels': channels,
+        'contract': contract,
+        'fallback': fallback,
+        # All table needles, matched in one pass over the container text
+        'keywords': KeywordScanner(
+            needle for table in (contract_map, _CATEGORY_MAP, promo_map) for needle, _ in table
+        )
+    }
+
+def _parse_tv_container(cfg: Dict[str, Any], container) -> Optional[TvPackage]:
+    """Parse a single TV package container"""
+    try:
+        # Extract package details
+        name_elem = select_first(_NAME_SELS, container)
+        price_elem = select_one(_PRICE_SEL, container)
+        channels_elem = select_one(_CHANNELS_SEL, container)
+        
+        if name_elem is not None and price_elem is not None:
+            package_name = name_elem.text_content().strip()
+            price_text = price_elem.text_content().strip()
+            channels_text = channels_elem.text_content().strip() if channels_elem is not None else ""
+            
+            # Parse price
+            price = parse_amount(price_text)
+            
+            # Parse channels
+            channels = int(channels_text) if channels_text.isdigit() else cfg['channels']
+            
+            # Read the container text once for all keyword checks
+            keyword_hits = cfg['keywords'].scan(container.text_content().casefold())
+            
+            # Check for contract length
+            contract_months = first_match(cfg['contract_map'], keyword_hits, cfg['contract'])
+            
+            # Determine category
+            category = first_match(_CATEGORY_MAP, keyword_hits, 'Film & Serier')
+            
+            # Check for promotions
+            promotion = first_match(cfg['promo_map'], keyword_hits, '')
+            
+            return TvPackage(
+                id=0,
+                udbyder=cfg['name'],
+                pakke_navn=package_name,
+                kanaler=channels,
+                pris_mdr=price,
+                bindingstid_mdr=contract_months,
+                kampagne=promotion,
+                kategori=category,
+                cta_url=cfg['url']
+            )
+    except Exception as e:
+        logger.warning("Error parsing %s package: %s", cfg['name'], e)
+    
+    return None
+
+def scrape_generic_tv(cfg: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Scrape a provider's TV packages as described by its config"""
+    packages = []
+    
+    try:
+        tree = fetch_tree(cfg['url'])
+        
+        # Find TV package containers
+        package_containers = _CONTAINER_SEL(tree)
+        
+        records = [p for p in (_parse_tv_container(cfg, c) for c in package_containers) if p]
+        for i, package in enumerate(records, 1):
+            package.id = i
+        
+        packages = [asdict(p) for p in records]
+    
+    except Exception as e:
+        logger.error("Error scraping %s TV: %s", cfg['name'], e)
+        # Return fallback data
+        packages = [asdict(p) for p in cfg['fallback']]
+    
+    logger.info("Scraped %d %s TV packages", len(packages), cfg['name'])
+    return packages
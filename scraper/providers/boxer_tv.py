@@ -3,141 +3,64 @@
 Boxer TV Packages Scraper
 """
 
-import requests
-from bs4 import BeautifulSoup
-import logging
 from typing import List, Dict, Any
 
-logger = logging.getLogger(__name__)
+from _models import TvPackage
+from _tv_generic import make_tv_config, scrape_generic_tv
+
+BOXER_TV_CFG = make_tv_config(
+    name='Boxer',
+    url='https://www.boxer.dk/tv/pakker',
+    promo_map=(
+        ('ingen binding', 'Ingen bindingstid'),
+        ('gratis', 'Første måned gratis'),
+        ('halv pris', 'Halv pris første måned')
+    ),
+    channels=30,
+    contract=0,
+    contract_map=(
+        ('ingen binding', 0),
+        ('6 måneder', 6),
+        ('12 måneder', 12)
+    ),
+    # Fallback data used when the page cannot be scraped
+    fallback=(
+        TvPackage(
+            id=1,
+            udbyder='Boxer',
+            pakke_navn='Flex 8',
+            kanaler=30,
+            pris_mdr=299,
+            bindingstid_mdr=0,
+            kampagne='Ingen bindingstid',
+            kategori='Basis',
+            cta_url='https://www.boxer.dk/tv/pakker'
+        ),
+        TvPackage(
+            id=2,
+            udbyder='Boxer',
+            pakke_navn='Flex 20',
+            kanaler=50,
+            pris_mdr=429,
+            bindingstid_mdr=0,
+            kampagne='Første måned gratis',
+            kategori='Film & Serier',
+            cta_url='https://www.boxer.dk/tv/pakker'
+        ),
+        TvPackage(
+            id=3,
+            udbyder='Boxer',
+            pakke_navn='Flex Sport',
+            kanaler=45,
+            pris_mdr=479,
+            bindingstid_mdr=0,
+            kampagne='Ingen bindingstid',
+            kategori='Sport',
+            cta_url='https://www.boxer.dk/tv/pakker'
+        )
+    )
+)
 
 def scrape_boxer_tv() -> List[Dict[str, Any]]:
     """Scrape Boxer TV packages"""
-    packages = []
-    
-    try:
-        # Boxer TV packages URL
-        url = "https://www.boxer.dk/tv/pakker"
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Find TV package containers
-        package_containers = soup.find_all('div', class_=['package-card', 'tv-package', 'subscription-card'])
-        
-        for container in package_containers:
-            try:
-                # Extract package details
-                name_elem = container.find(['h3', 'h4', '.package-name', '.tv-package-name'])
-                price_elem = container.find(['.price', '.monthly-price', '.cost'])
-                channels_elem = container.find(['.channels', '.kanaler', '.channel-count'])
-                
-                if name_elem and price_elem:
-                    package_name = name_elem.get_text(strip=True)
-                    price_text = price_elem.get_text(strip=True)
-                    channels_text = channels_elem.get_text(strip=True) if channels_elem else "30"
-                    
-                    # Parse price
-                    price = 0
-                    if 'kr' in price_text:
-                        price_str = ''.join(filter(str.isdigit, price_text))
-                        if price_str:
-                            price = int(price_str)
-                    
-                    # Parse channels
-                    channels = 30  # Default
-                    if channels_text and channels_text.isdigit():
-                        channels = int(channels_text)
-                    
-                    # Check for contract length (Boxer typically has no contract)
-                    contract_text = container.get_text()
-                    contract_months = 0
-                    if 'ingen binding' in contract_text.lower():
-                        contract_months = 0
-                    elif '6 måneder' in contract_text:
-                        contract_months = 6
-                    elif '12 måneder' in contract_text:
-                        contract_months = 12
-                    
-                    # Determine category
-                    category = "Film & Serier"
-                    if 'sport' in contract_text.lower():
-                        category = "Sport"
-                    elif 'basis' in contract_text.lower() or 'grund' in contract_text.lower():
-                        category = "Basis"
-                    elif 'total' in contract_text.lower() or 'komplet' in contract_text.lower():
-                        category = "All Inclusive"
-                    
-                    # Check for promotions
-                    promotion = ""
-                    if 'ingen binding' in contract_text.lower():
-                        promotion = "Ingen bindingstid"
-                    elif 'gratis' in contract_text.lower():
-                        promotion = "Første måned gratis"
-                    elif 'halv pris' in contract_text.lower():
-                        promotion = "Halv pris første måned"
-                    
-                    package = {
-                        'id': len(packages) + 1,
-                        'udbyder': 'Boxer',
-                        'pakke_navn': package_name,
-                        'kanaler': channels,
-                        'pris_mdr': price,
-                        'bindingstid_mdr': contract_months,
-                        'kampagne': promotion,
-                        'kategori': category,
-                        'cta_url': 'https://www.boxer.dk/tv/pakker'
-                    }
-                    
-                    packages.append(package)
-                    
-            except Exception as e:
-                logger.warning(f"Error parsing Boxer package: {e}")
-                continue
-    
-    except Exception as e:
-        logger.error(f"Error scraping Boxer TV: {e}")
-        # Return fallback data
-        packages = [
-            {
-                'id': 1,
-                'udbyder': 'Boxer',
-                'pakke_navn': 'Flex 8',
-                'kanaler': 30,
-                'pris_mdr': 299,
-                'bindingstid_mdr': 0,
-                'kampagne': 'Ingen bindingstid',
-                'kategori': 'Basis',
-                'cta_url': 'https://www.boxer.dk/tv/pakker'
-            },
-            {
-                'id': 2,
-                'udbyder': 'Boxer',
-                'pakke_navn': 'Flex 20',
-                'kanaler': 50,
-                'pris_mdr': 429,
-                'bindingstid_mdr': 0,
-                'kampagne': 'Første måned gratis',
-                'kategori': 'Film & Serier',
-                'cta_url': 'https://www.boxer.dk/tv/pakker'
-            },
-            {
-                'id': 3,
-                'udbyder': 'Boxer',
-                'pakke_navn': 'Flex Sport',
-                'kanaler': 45,
-                'pris_mdr': 479,
-                'bindingstid_mdr': 0,
-                'kampagne': 'Ingen bindingstid',
-                'kategori': 'Sport',
-                'cta_url': 'https://www.boxer.dk/tv/pakker'
-            }
-        ]
-    
-    logger.info(f"Scraped {len(packages)} Boxer TV packages")
-    return packages
+    return scrape_generic_tv(BOXER_TV_CFG)
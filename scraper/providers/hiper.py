@@ -2,14 +2,32 @@
 Hiper.dk scraper
 """
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import logging
 import time
 import re
 
+import soupsieve as sv
+
+from _http import fetch_page
+from _parsers import extract_speed, extract_price, extract_contract_length, field_lines
+
 logger = logging.getLogger(__name__)
 
+_TITLE_CLASS_RE = re.compile(r'title|name|plan', re.I)
+
+_CARD_WORDS = ('plan', 'package', 'price', 'card')
+
+# div/section elements whose class mentions any of the card words (case-insensitive),
+# compiled once at import instead of on every select()
+_CARD_SEL = sv.compile(', '.join(
+    f'{tag}[class*="{word}" i]' for tag in ('div', 'section') for word in _CARD_WORDS
+))
+
+# Only card subtrees (or, for the fallback, tables) are consulted, so skip building the rest of the page
+_CARD_STRAINER = SoupStrainer(['div', 'section'], class_=re.compile('|'.join(_CARD_WORDS), re.I))
+_TABLE_STRAINER = SoupStrainer('table')
+
 def scrape_hiper():
     """Scrape fiber internet plans from Hiper.dk"""
     plans = []
@@ -18,52 +36,29 @@ def scrape_hiper():
         # Hiper fiber internet page
         url = "https://www.hiper.dk/internet/fiber-internet"
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
+        html = fetch_page(url)
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml', from_encoding='utf-8', parse_only=_CARD_STRAINER)
         
         # Look for plan cards or pricing tables
-        plan_cards = soup.find_all(['div', 'section'], class_=re.compile(r'plan|package|price|card', re.I))
+        plan_cards = _CARD_SEL.select(soup)
         
         for card in plan_cards:
             try:
                 # Extract plan name
                 plan_name = ""
-                name_elem = card.find(['h2', 'h3', 'h4', 'span'], class_=re.compile(r'title|name|plan', re.I))
+                name_elem = card.find(['h2', 'h3', 'h4', 'span'], class_=_TITLE_CLASS_RE)
                 if name_elem:
                     plan_name = name_elem.get_text(strip=True)
                 
-                # Extract speed
-                speed = 0
-                speed_elem = card.find(text=re.compile(r'\d+\s*(mbit|mb|gb|gbit)', re.I))
-                if speed_elem:
-                    speed_text = speed_elem.strip()
-                    speed = extract_speed(speed_text)
-                
-                # Extract price
-                price = 0
-                price_elem = card.find(text=re.compile(r'\d+\s*(kr|dkk)', re.I))
-                if price_elem:
-                    price_text = price_elem.strip()
-                    price = extract_price(price_text)
+                # One walk over the card's text nodes; the first node holding
+                # each marker is the source for that field
+                fields = field_lines(card.stripped_strings)
                 
-                # Extract contract length
-                contract = 0
-                contract_elem = card.find(text=re.compile(r'\d+\s*(måned|mdr|år)', re.I))
-                if contract_elem:
-                    contract_text = contract_elem.strip()
-                    contract = extract_contract_length(contract_text)
-                
-                # Extract promotion
-                promotion = ""
-                promo_elem = card.find(text=re.compile(r'(gratis|rabat|tilbud|kampagne)', re.I))
-                if promo_elem:
-                    promotion = promo_elem.strip()
+                speed = extract_speed(fields.get('speed'))
+                price = extract_price(fields.get('price'))
+                contract = extract_contract_length(fields.get('contract'))
+                promotion = fields.get('promo', '')
                 
                 if speed > 0 and price > 0:
                     plans.append({
@@ -85,7 +80,7 @@ def scrape_hiper():
         # If no plans found with the above method, try alternative selectors
         if not plans:
             # Try to find pricing tables
-            tables = soup.find_all('table')
+            tables = BeautifulSoup(html, 'lxml', from_encoding='utf-8', parse_only=_TABLE_STRAINER).find_all('table')
             for table in tables:
                 rows = table.find_all('tr')[1:]  # Skip header
                 for row in rows:
@@ -123,48 +118,3 @@ def scrape_hiper():
         logger.error(f"Error scraping Hiper: {e}")
     
     return plans
-
-def extract_speed(text):
-    """Extract speed from text"""
-    if not text:
-        return 0
-    
-    # Look for Gbit/s
-    gbit_match = re.search(r'(\d+)\s*(gbit|gb)', text.lower())
-    if gbit_match:
-        return int(gbit_match.group(1)) * 1000
-    
-    # Look for Mbit/s
-    mbit_match = re.search(r'(\d+)\s*(mbit|mb)', text.lower())
-    if mbit_match:
-        return int(mbit_match.group(1))
-    
-    return 0
-
-def extract_price(text):
-    """Extract price from text"""
-    if not text:
-        return 0
-    
-    price_match = re.search(r'(\d+)', text.replace(' ', '').replace(',', '.'))
-    if price_match:
-        return int(price_match.group(1))
-    
-    return 0
-
-def extract_contract_length(text):
-    """Extract contract length from text"""
-    if not text:
-        return 0
-    
-    # Look for months
-    month_match = re.search(r'(\d+)\s*(måned|mdr)', text.lower())
-    if month_match:
-        return int(month_match.group(1))
-    
-    # Look for years
-    year_match = re.search(r'(\d+)\s*år', text.lower())
-    if year_match:
-        return int(year_match.group(1)) * 12
-    
-    return 0
@@ -1,28 +1,58 @@
 """Hiper Pro (Business) scraper"""
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import logging
 import re
 
+import soupsieve as sv
+
+from lxml import etree
+
+from _html import parse_html
+from _http import fetch_page
+from _parsers import extract_speed, extract_price
+from _regex import DIGIT_RE
+
 logger = logging.getLogger(__name__)
 
+# Text nodes matched inside libxml2 through the EXSLT regular-expression extension
+_REGEXP_NS = {'re': 'http://exslt.org/regular-expressions'}
+_BUSINESS_TEXT_XPATH = etree.XPath(
+    r"//text()[re:test(., '(business|erhverv).*\d+\s*(mbit|mb)', 'i')]", namespaces=_REGEXP_NS
+)
+_PRICE_TEXT_XPATH = etree.XPath(
+    r".//text()[re:test(., '\d+\s*(kr|dkk)', 'i')]", namespaces=_REGEXP_NS
+)
+
+_CARD_WORDS = ('plan', 'package', 'price', 'card', 'product', 'offer', 'business')
+
+# div/section elements whose class mentions any of the card words (case-insensitive),
+# compiled once at import instead of on every select()
+_CARD_SEL = sv.compile(', '.join(
+    f'{tag}[class*="{word}" i]' for tag in ('div', 'section') for word in _CARD_WORDS
+))
+
+# Only card subtrees are consulted by the main pass, so skip building the rest of the page
+_CARD_STRAINER = SoupStrainer(['div', 'section'], class_=re.compile('|'.join(_CARD_WORDS), re.I))
+
 def scrape_hiper_pro():
     plans = []
     try:
         # Hiper Pro business page
         url = "https://www.hiper.dk/erhverv/internet/fiber"
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        html = fetch_page(url)
+        soup = BeautifulSoup(html, 'lxml', from_encoding='utf-8', parse_only=_CARD_STRAINER)
         
         # Look for business plan sections
-        plan_sections = soup.find_all(['div', 'section'], class_=re.compile(r'plan|package|price|card|product|offer|business', re.I))
+        plan_sections = _CARD_SEL.select(soup)
         
         for section in plan_sections:
             try:
-                speed = extract_speed(section.get_text())
-                price = extract_price(section.get_text())
+                # Layout sections without any digits cannot hold a plan
+                section_text = section.get_text(' ', strip=True)
+                if not DIGIT_RE.search(section_text):
+                    continue
+                speed = extract_speed(section_text)
+                price = extract_price(section_text)
                 if speed > 0 and price > 0:
                     plans.append({
                         'udbyder': 'Hiper Pro',
@@ -41,16 +71,21 @@ def scrape_hiper_pro():
         
         # Alternative approach: look for business-specific patterns
         if not plans:
-            # Try to find business plans by looking for specific text patterns
-            business_plans = soup.find_all(text=re.compile(r'(business|erhverv).*\d+\s*(mbit|mb)', re.I))
+            # Try to find business plans by looking for specific text patterns;
+            # they can sit anywhere on the page, so parse it in full here
+            tree = parse_html(html)
+            business_plans = _BUSINESS_TEXT_XPATH(tree)
             for plan_text in business_plans:
                 try:
-                    parent = plan_text.parent
-                    if parent:
+                    # Tail text belongs to the element enclosing its owner
+                    parent = plan_text.getparent()
+                    if plan_text.is_tail and parent is not None:
+                        parent = parent.getparent()
+                    if parent is not None:
                         # Look for price in the same container
-                        price_elem = parent.find(text=re.compile(r'\d+\s*(kr|dkk)', re.I))
+                        price_elem = next(iter(_PRICE_TEXT_XPATH(parent)), None)
                         if price_elem:
-                            speed = extract_speed(plan_text)
+                            speed = extract_speed(str(plan_text))  # plain str, so the cache doesn't pin the tree
                             price = extract_price(price_elem.strip())
                             
                             if speed > 0 and price > 0:
@@ -75,25 +110,3 @@ def scrape_hiper_pro():
         logger.error(f"Error scraping Hiper Pro: {e}")
     
     return plans
-
-def extract_speed(text):
-    if not text: return 0
-    gbit_match = re.search(r'(\d+)\s*(gbit|gb)', text.lower())
-    if gbit_match: return int(gbit_match.group(1)) * 1000
-    mbit_match = re.search(r'(\d+)\s*(mbit|mb)', text.lower())
-    if mbit_match: return int(mbit_match.group(1))
-    return 0
-
-def extract_price(text):
-    if not text: return 0
-    price_match = re.search(r'(\d+)', text.replace(' ', '').replace(',', '.'))
-    if price_match: return int(price_match.group(1))
-    return 0
-
-def extract_contract_length(text):
-    if not text: return 0
-    month_match = re.search(r'(\d+)\s*(måned|mdr)', text.lower())
-    if month_match: return int(month_match.group(1))
-    year_match = re.search(r'(\d+)\s*år', text.lower())
-    if year_match: return int(year_match.group(1)) * 12
-    return 0
@@ -2,12 +2,14 @@
 Telenor.dk scraper
 """
 
-import requests
 from bs4 import BeautifulSoup
 import logging
 import time
 import re
 
+from _http import fetch_page
+from _parsers import extract_speed, extract_price
+
 logger = logging.getLogger(__name__)
 
 def scrape_telenor():
@@ -16,11 +18,8 @@ def scrape_telenor():
     
     try:
         url = "https://www.telenor.dk/privat/internet/fiber"
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        html = fetch_page(url)
+        soup = BeautifulSoup(html, 'lxml', from_encoding='utf-8')
         
         # Look for plan sections
         plan_sections = soup.find_all(['div', 'section'], class_=re.compile(r'plan|package|price|card', re.I))
@@ -52,33 +51,3 @@ def scrape_telenor():
         logger.error(f"Error scraping Telenor: {e}")
     
     return plans
-
-def extract_speed(text):
-    if not text:
-        return 0
-    gbit_match = re.search(r'(\d+)\s*(gbit|gb)', text.lower())
-    if gbit_match:
-        return int(gbit_match.group(1)) * 1000
-    mbit_match = re.search(r'(\d+)\s*(mbit|mb)', text.lower())
-    if mbit_match:
-        return int(mbit_match.group(1))
-    return 0
-
-def extract_price(text):
-    if not text:
-        return 0
-    price_match = re.search(r'(\d+)', text.replace(' ', '').replace(',', '.'))
-    if price_match:
-        return int(price_match.group(1))
-    return 0
-
-def extract_contract_length(text):
-    if not text:
-        return 0
-    month_match = re.search(r'(\d+)\s*(måned|mdr)', text.lower())
-    if month_match:
-        return int(month_match.group(1))
-    year_match = re.search(r'(\d+)\s*år', text.lower())
-    if year_match:
-        return int(year_match.group(1)) * 12
-    return 0
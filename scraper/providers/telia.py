@@ -2,12 +2,14 @@
 Telia.dk scraper
 """
 
-import requests
 from bs4 import BeautifulSoup
 import logging
 import time
 import re
 
+from _http import fetch_page
+from _parsers import extract_speed, extract_price, extract_contract_length
+
 logger = logging.getLogger(__name__)
 
 def scrape_telia():
@@ -18,14 +20,9 @@ def scrape_telia():
         # Telia fiber internet page
         url = "https://www.telia.dk/privat/internet/fiber"
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
+        html = fetch_page(url)
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml', from_encoding='utf-8')
         
         # Look for plan cards or pricing sections
         plan_sections = soup.find_all(['div', 'section'], class_=re.compile(r'plan|package|price|card|product|offer', re.I))
@@ -120,48 +117,3 @@ def scrape_telia():
         logger.error(f"Error scraping Telia: {e}")
     
     return plans
-
-def extract_speed(text):
-    """Extract speed from text"""
-    if not text:
-        return 0
-    
-    # Look for Gbit/s
-    gbit_match = re.search(r'(\d+)\s*(gbit|gb)', text.lower())
-    if gbit_match:
-        return int(gbit_match.group(1)) * 1000
-    
-    # Look for Mbit/s
-    mbit_match = re.search(r'(\d+)\s*(mbit|mb)', text.lower())
-    if mbit_match:
-        return int(mbit_match.group(1))
-    
-    return 0
-
-def extract_price(text):
-    """Extract price from text"""
-    if not text:
-        return 0
-    
-    price_match = re.search(r'(\d+)', text.replace(' ', '').replace(',', '.'))
-    if price_match:
-        return int(price_match.group(1))
-    
-    return 0
-
-def extract_contract_length(text):
-    """Extract contract length from text"""
-    if not text:
-        return 0
-    
-    # Look for months
-    month_match = re.search(r'(\d+)\s*(måned|mdr)', text.lower())
-    if month_match:
-        return int(month_match.group(1))
-    
-    # Look for years
-    year_match = re.search(r'(\d+)\s*år', text.lower())
-    if year_match:
-        return int(year_match.group(1)) * 12
-    
-    return 0
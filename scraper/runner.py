@@ -0,0 +1,38 @@
+"""
+Concurrent execution of provider scrapers
+"""
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import List, Dict, Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of providers scraped at the same time; covers every
+# provider list, so none waits in the queue behind a slow host
+MAX_WORKERS = 16
+
+# Seconds to wait for the whole batch before giving up on slow providers.
+# _http bounds each page fetch below this, so it also bounds the run.
+BATCH_TIMEOUT = 60
+
+def run_all(providers: List[Dict[str, Any]], max_workers: int = MAX_WORKERS, timeout: float = BATCH_TIMEOUT) -> List[Tuple[Dict[str, Any], Future]]:
+    """Run provider scrapers in a thread pool and return (provider, future) pairs in configuration order"""
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = []
+    for provider in providers:
+        logger.info("Scraping %s...", provider['name'])
+        futures.append((provider, executor.submit(provider['scraper'])))
+
+    _, not_done = wait([future for _, future in futures], timeout=timeout)
+
+    # A provider still running here has outlived its own request timeouts;
+    # its future raises TimeoutError, or CancelledError if it never started.
+    # Running threads cannot be stopped and are joined at interpreter exit.
+    for provider, future in futures:
+        if future in not_done:
+            logger.warning("Timed out waiting for %s after %ss", provider['name'], timeout)
+            future.cancel()
+
+    executor.shutdown(wait=False, cancel_futures=True)
+    return futures
@@ -4,13 +4,15 @@ Fiber Internet Scraper for Denmark
 Scrapes fiber internet plans from major Danish providers
 """
 
-import json
 import logging
 import os
+import re
 import sys
+from collections import Counter
+from concurrent.futures import CancelledError, TimeoutError as FutureTimeoutError
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 # Add providers directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'providers'))
@@ -33,6 +35,9 @@ from fastspeed import scrape_fastspeed
 from ewii_fiber import scrape_ewii_fiber
 from hiper_pro import scrape_hiper_pro
 
+from jsonio import load_json, save_json
+from runner import BATCH_TIMEOUT, run_all
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -128,6 +133,10 @@ PROVIDERS = [
     }
 ]
 
+# Number patterns used by the normalizers, compiled once
+_DIGITS_RE = re.compile(r'\d+')
+_FLOAT_RE = re.compile(r'\d+\.?\d*')
+
 def normalize_speed(speed_str: str) -> int:
     """Normalize speed values to Mbit/s"""
     if not speed_str:
@@ -153,10 +162,9 @@ def normalize_speed(speed_str: str) -> int:
     
     # Try to extract number
     try:
-        import re
-        numbers = re.findall(r'\d+', speed_str)
-        if numbers:
-            return int(numbers[0])
+        number = _DIGITS_RE.search(speed_str)
+        if number:
+            return int(number.group())
     except:
         pass
     
@@ -167,13 +175,19 @@ def normalize_price(price_str: str) -> int:
     if not price_str:
         return 0
     
-    price_str = str(price_str).replace(' ', '').replace('kr', '').replace('dkk', '').replace(',', '.')
+    price_str = str(price_str)
+    
+    # Common case: a whole number followed by the currency
+    quick = price_str.rstrip(' dkrDKR')
+    if quick.isdecimal():
+        return int(quick)
+    
+    price_str = price_str.replace(' ', '').replace('kr', '').replace('dkk', '').replace(',', '.')
     
     try:
-        import re
-        numbers = re.findall(r'\d+\.?\d*', price_str)
-        if numbers:
-            return int(float(numbers[0]))
+        number = _FLOAT_RE.search(price_str)
+        if number:
+            return int(float(number.group()))
     except:
         pass
     
@@ -189,47 +203,49 @@ def normalize_contract_length(contract_str: str) -> int:
     # Handle months
     if 'måned' in contract_str or 'mdr' in contract_str:
         try:
-            import re
-            numbers = re.findall(r'\d+', contract_str)
-            if numbers:
-                return int(numbers[0])
+            number = _DIGITS_RE.search(contract_str)
+            if number:
+                return int(number.group())
         except:
             pass
     
     # Handle years
     if 'år' in contract_str or 'year' in contract_str:
         try:
-            import re
-            numbers = re.findall(r'\d+', contract_str)
-            if numbers:
-                return int(numbers[0]) * 12
+            number = _DIGITS_RE.search(contract_str)
+            if number:
+                return int(number.group()) * 12
         except:
             pass
     
     # Try to extract number
     try:
-        import re
-        numbers = re.findall(r'\d+', contract_str)
-        if numbers:
-            return int(numbers[0])
+        number = _DIGITS_RE.search(contract_str)
+        if number:
+            return int(number.group())
     except:
         pass
     
     return 0
 
-def scrape_all_providers() -> List[Dict[str, Any]]:
-    """Scrape all enabled providers"""
+def scrape_all_providers() -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Scrape all enabled providers, returning the plans and the providers that timed out"""
     all_plans = []
+    timed_out = []
     
+    providers_to_run = []
     for provider in PROVIDERS:
         if not provider['enabled']:
-            logger.info(f"Skipping {provider['name']} (disabled)")
+            logger.info("Skipping %s (disabled)", provider['name'])
             continue
         
-        logger.info(f"Scraping {provider['name']}...")
-        
+        providers_to_run.append(provider)
+    
+    # Provider scrapers block on network I/O, so run them in a thread pool
+    # and process the results in configuration order
+    for provider, future in run_all(providers_to_run):
         try:
-            plans = provider['scraper']()
+            plans = future.result(timeout=0)
             
             # Normalize and validate data
             normalized_plans = []
@@ -250,33 +266,37 @@ def scrape_all_providers() -> List[Dict[str, Any]]:
                 if normalized_plan['hastighed_mbit'] > 0 and normalized_plan['pris_mdr'] > 0:
                     normalized_plans.append(normalized_plan)
                 else:
-                    logger.warning(f"Invalid plan data for {provider['name']}: {plan}")
+                    logger.warning("Invalid plan data for %s: %s", provider['name'], plan)
             
             all_plans.extend(normalized_plans)
-            logger.info(f"Scraped {len(normalized_plans)} plans from {provider['name']}")
+            logger.info("Scraped %d plans from %s", len(normalized_plans), provider['name'])
+            
+        except (CancelledError, FutureTimeoutError):
+            logger.error("Timed out scraping %s after %ss", provider['name'], BATCH_TIMEOUT)
+            timed_out.append(provider['name'])
             
         except Exception as e:
-            logger.error(f"Error scraping {provider['name']}: {str(e)}")
+            logger.error("Error scraping %s: %s", provider['name'], e)
             continue
     
-    return all_plans
+    return all_plans, timed_out
 
-def save_to_json(data: List[Dict[str, Any]], output_path: str):
-    """Save data to JSON file with metadata"""
+def save_to_json(data: List[Dict[str, Any]], *output_paths: str):
+    """Save data to one or more JSON files with metadata"""
     output_data = {
         'last_updated': datetime.now().isoformat(),
         'total_plans': len(data),
-        'providers': list(set([plan['udbyder'] for plan in data])),
+        'providers': sorted({plan['udbyder'] for plan in data}),
         'plans': data
     }
     
-    # Ensure output directory exists
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    # Ensure output directories exist
+    for output_path in output_paths:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, ensure_ascii=False, indent=2)
+    save_json(output_data, *output_paths)
     
-    logger.info(f"Saved {len(data)} plans to {output_path}")
+    logger.info(f"Saved {len(data)} plans to {', '.join(output_paths)}")
 
 def main():
     """Main scraping function"""
@@ -295,8 +315,7 @@ def main():
         
         # For light check, we'll just validate existing data
         try:
-            with open('../data/fiber.json', 'r', encoding='utf-8') as f:
-                existing_data = json.load(f)
+            existing_data = load_json('../data/fiber.json')
             logger.info(f"Light check completed - {len(existing_data)} providers in database")
             return
         except Exception as e:
@@ -325,27 +344,27 @@ def main():
     
     # Full scraping mode
     logger.info("Full scraping mode - checking all providers")
-    all_plans = scrape_all_providers()
+    all_plans, timed_out = scrape_all_providers()
     
-    # Save to JSON
-    output_path = '../data/fiber.json'
-    save_to_json(all_plans, output_path)
+    # A run missing whole providers would drop their plans from the site
+    if timed_out:
+        logger.error("Not saving a partial run; timed out: %s", ', '.join(timed_out))
+        print(f"SCRAPER_RESULT: not saved, {len(timed_out)} providers timed out")
+        return
     
-    # Also save to scraper data directory
+    # Save to JSON, and also to the scraper data directory
+    output_path = '../data/fiber.json'
     scraper_output_path = 'data/fiber.json'
-    save_to_json(all_plans, scraper_output_path)
+    save_to_json(all_plans, output_path, scraper_output_path)
     
     logger.info(f"Scraping completed. Total plans: {len(all_plans)}")
     
     # Print summary
-    provider_counts = {}
-    for plan in all_plans:
-        provider = plan['udbyder']
-        provider_counts[provider] = provider_counts.get(provider, 0) + 1
+    provider_counts = Counter(plan['udbyder'] for plan in all_plans)
     
     logger.info("Provider summary:")
     for provider, count in provider_counts.items():
-        logger.info(f"  {provider}: {count} plans")
+        logger.info("  %s: %d plans", provider, count)
     
     # Log for GitHub Actions
     print(f"SCRAPER_RESULT: {len(all_plans)} plans scraped from {len(provider_counts)} providers")
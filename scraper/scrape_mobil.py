@@ -4,10 +4,10 @@ Mobile Plans Scraper for Denmark
 Scrapes mobile subscription plans from major Danish providers
 """
 
-import json
 import logging
 import os
 import sys
+from concurrent.futures import CancelledError, TimeoutError as FutureTimeoutError
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any
@@ -32,6 +32,9 @@ from callme import scrape_callme
 from lycamobile import scrape_lycamobile
 from gomore import scrape_gomore
 
+from jsonio import load_json, save_json
+from runner import BATCH_TIMEOUT, run_all
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -127,8 +130,7 @@ def load_existing_data() -> List[Dict[str, Any]]:
     data_file = Path('../data/mobil.json')
     if data_file.exists():
         try:
-            with open(data_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return load_json(data_file)
         except Exception as e:
             logger.warning(f"Could not load existing data: {e}")
     return []
@@ -139,39 +141,41 @@ def save_data(data: List[Dict[str, Any]]) -> None:
     data_file.parent.mkdir(exist_ok=True)
     
     try:
-        with open(data_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        save_json(data, data_file)
         logger.info(f"Saved {len(data)} mobile plans to {data_file}")
     except Exception as e:
         logger.error(f"Could not save data: {e}")
         raise
 
-def scrape_mobile_providers(scraper_type: str = 'full') -> List[Dict[str, Any]]:
-    """Scrape mobile plans from all enabled providers"""
+def scrape_mobile_providers(scraper_type: str = 'full', previous: List[Dict[str, Any]] = ()) -> List[Dict[str, Any]]:
+    """Scrape mobile plans from all enabled providers, keeping previous plans of any that time out"""
     all_plans = []
     successful_providers = 0
     failed_providers = 0
     
     logger.info(f"Starting mobile scraping (type: {scraper_type})")
     
+    providers_to_run = []
     for provider_config in MOBILE_PROVIDERS:
         if not provider_config['enabled']:
-            logger.info(f"Skipping disabled provider: {provider_config['name']}")
+            logger.info("Skipping disabled provider: %s", provider_config['name'])
             continue
             
+        if scraper_type == 'light':
+            # For light scraping, only check a few key providers
+            if provider_config['name'] not in ['Telia', 'Telenor', 'YouSee', 'Oister', 'Lebara']:
+                logger.info("Skipping %s in light mode", provider_config['name'])
+                continue
+        
+        providers_to_run.append(provider_config)
+    
+    # Providers are network bound, so fetch them concurrently and collect
+    # the results in configuration order
+    for provider_config, future in run_all(providers_to_run):
         provider_name = provider_config['name']
-        scraper_func = provider_config['scraper']
         
         try:
-            logger.info(f"Scraping {provider_name}...")
-            
-            if scraper_type == 'light':
-                # For light scraping, only check a few key providers
-                if provider_name not in ['Telia', 'Telenor', 'YouSee', 'Oister', 'Lebara']:
-                    logger.info(f"Skipping {provider_name} in light mode")
-                    continue
-            
-            plans = scraper_func()
+            plans = future.result(timeout=0)
             
             if plans:
                 # Add metadata to each plan
@@ -181,13 +185,20 @@ def scrape_mobile_providers(scraper_type: str = 'full') -> List[Dict[str, Any]]:
                 
                 all_plans.extend(plans)
                 successful_providers += 1
-                logger.info(f"✓ {provider_name}: {len(plans)} plans found")
+                logger.info("✓ %s: %d plans found", provider_name, len(plans))
             else:
-                logger.warning(f"⚠ {provider_name}: No plans found")
+                logger.warning("⚠ %s: No plans found", provider_name)
                 failed_providers += 1
                 
+        except (CancelledError, FutureTimeoutError):
+            # Rather than report them all as removed, carry the last run's plans over
+            kept = [plan for plan in previous if plan.get('provider', plan.get('udbyder')) == provider_name]
+            all_plans.extend(kept)
+            logger.error("✗ %s: timed out after %ss, keeping %d plans from the previous run", provider_name, BATCH_TIMEOUT, len(kept))
+            failed_providers += 1
+            
         except Exception as e:
-            logger.error(f"✗ {provider_name}: Error - {e}")
+            logger.error("✗ %s: Error - %s", provider_name, e)
             failed_providers += 1
             continue
     
@@ -196,6 +207,10 @@ def scrape_mobile_providers(scraper_type: str = 'full') -> List[Dict[str, Any]]:
     
     return all_plans
 
+def plan_key(plan: Dict[str, Any]) -> tuple:
+    """Identity of a plan when comparing runs"""
+    return (plan.get('udbyder', ''), plan.get('data_GB', ''), plan.get('pris_mdr', ''))
+
 def detect_changes(old_data: List[Dict[str, Any]], new_data: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Detect changes between old and new data"""
     changes = {
@@ -206,19 +221,13 @@ def detect_changes(old_data: List[Dict[str, Any]], new_data: List[Dict[str, Any]
         'promotion_changes': 0
     }
     
-    # Create lookup dictionaries
-    old_lookup = {f"{plan.get('udbyder', '')}-{plan.get('data_GB', '')}-{plan.get('pris_mdr', '')}": plan for plan in old_data}
-    new_lookup = {f"{plan.get('udbyder', '')}-{plan.get('data_GB', '')}-{plan.get('pris_mdr', '')}": plan for plan in new_data}
-    
-    # Find new plans
-    for key, plan in new_lookup.items():
-        if key not in old_lookup:
-            changes['new_plans'] += 1
+    # Create lookup dictionaries keyed on (provider, data, price) tuples
+    old_lookup = {plan_key(plan): plan for plan in old_data}
+    new_lookup = {plan_key(plan): plan for plan in new_data}
     
-    # Find removed plans
-    for key, plan in old_lookup.items():
-        if key not in new_lookup:
-            changes['removed_plans'] += 1
+    # Find new and removed plans
+    changes['new_plans'] = len(new_lookup.keys() - old_lookup.keys())
+    changes['removed_plans'] = len(old_lookup.keys() - new_lookup.keys())
     
     # Find updated plans
     for key, new_plan in new_lookup.items():
@@ -245,12 +254,12 @@ def main():
     
     logger.info(f"Mobile scraper started - Type: {scraper_type}, Force: {force_update}")
     
-    # Load existing data
+    # Load existing data; a forced update still needs it for an accurate summary
     existing_data = load_existing_data()
     logger.info(f"Loaded {len(existing_data)} existing mobile plans")
     
     # Scrape new data
-    new_data = scrape_mobile_providers(scraper_type)
+    new_data = scrape_mobile_providers(scraper_type, existing_data)
     
     if not new_data:
         logger.error("No data scraped. Exiting.")
@@ -4,33 +4,20 @@ TV Packages Scraper for Denmark
 Scrapes TV package plans from major Danish providers
 """
 
-import json
 import logging
 import os
 import sys
+from concurrent.futures import CancelledError, TimeoutError as FutureTimeoutError
 from datetime import datetime
+from importlib import import_module
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Tuple
 
 # Add providers directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'providers'))
 
-# Import TV provider scrapers
-from yousee_tv import scrape_yousee_tv
-from waoo_tv import scrape_waoo_tv
-from stofa_tv import scrape_stofa_tv
-from boxer_tv import scrape_boxer_tv
-from norlys_tv import scrape_norlys_tv
-from telia_tv import scrape_telia_tv
-from allente_tv import scrape_allente_tv
-from tdc_tv import scrape_tdc_tv
-from telenor_tv import scrape_telenor_tv
-from altibox_tv import scrape_altibox_tv
-from kviknet_tv import scrape_kviknet_tv
-from cbb_tv import scrape_cbb_tv
-from hiper_tv import scrape_hiper_tv
-from fastspeed_tv import scrape_fastspeed_tv
-from ewii_tv import scrape_ewii_tv
+from jsonio import append_ndjson, load_json, save_json
+from runner import BATCH_TIMEOUT, run_all
 
 # Configure logging
 logging.basicConfig(
@@ -43,92 +30,97 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# TV provider configuration
-TV_PROVIDERS = [
+# TV provider configuration; each module is imported only when its provider runs
+TV_PROVIDERS = (
     {
         'name': 'YouSee',
-        'scraper': scrape_yousee_tv,
+        'module': 'yousee_tv',
         'enabled': True
     },
     {
         'name': 'Waoo',
-        'scraper': scrape_waoo_tv,
+        'module': 'waoo_tv',
         'enabled': True
     },
     {
         'name': 'Stofa',
-        'scraper': scrape_stofa_tv,
+        'module': 'stofa_tv',
         'enabled': True
     },
     {
         'name': 'Boxer',
-        'scraper': scrape_boxer_tv,
+        'module': 'boxer_tv',
         'enabled': True
     },
     {
         'name': 'Norlys',
-        'scraper': scrape_norlys_tv,
+        'module': 'norlys_tv',
         'enabled': True
     },
     {
         'name': 'Telia TV',
-        'scraper': scrape_telia_tv,
+        'module': 'telia_tv',
         'enabled': True
     },
     {
         'name': 'Allente',
-        'scraper': scrape_allente_tv,
+        'module': 'allente_tv',
         'enabled': True
     },
     {
         'name': 'TDC',
-        'scraper': scrape_tdc_tv,
+        'module': 'tdc_tv',
         'enabled': True
     },
     {
         'name': 'Telenor',
-        'scraper': scrape_telenor_tv,
+        'module': 'telenor_tv',
         'enabled': True
     },
     {
         'name': 'Altibox',
-        'scraper': scrape_altibox_tv,
+        'module': 'altibox_tv',
         'enabled': True
     },
     {
         'name': 'Kviknet',
-        'scraper': scrape_kviknet_tv,
+        'module': 'kviknet_tv',
         'enabled': True
     },
     {
         'name': 'CBB',
-        'scraper': scrape_cbb_tv,
+        'module': 'cbb_tv',
         'enabled': True
     },
     {
         'name': 'Hiper',
-        'scraper': scrape_hiper_tv,
+        'module': 'hiper_tv',
         'enabled': True
     },
     {
         'name': 'Fastspeed',
-        'scraper': scrape_fastspeed_tv,
+        'module': 'fastspeed_tv',
         'enabled': True
     },
     {
         'name': 'Ewii',
-        'scraper': scrape_ewii_tv,
+        'module': 'ewii_tv',
         'enabled': True
     }
-]
+)
+
+# Providers checked in light mode
+LIGHT_TV_PROVIDERS = frozenset({'YouSee', 'Waoo', 'Stofa', 'Boxer', 'Norlys'})
+
+# The changelog is committed with tv.json; past this size its oldest lines are dropped
+MAX_CHANGELOG_BYTES = 1024 * 1024
 
 def load_existing_data() -> List[Dict[str, Any]]:
     """Load existing TV data from JSON file"""
     data_file = Path('../data/tv.json')
     if data_file.exists():
         try:
-            with open(data_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return load_json(data_file)
         except Exception as e:
             logger.warning(f"Could not load existing data: {e}")
     return []
@@ -139,53 +131,102 @@ def save_data(data: List[Dict[str, Any]]) -> None:
     data_file.parent.mkdir(exist_ok=True)
     
     try:
-        with open(data_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        save_json(data, data_file)
         logger.info(f"Saved {len(data)} TV packages to {data_file}")
     except Exception as e:
         logger.error(f"Could not save data: {e}")
         raise
 
-def scrape_tv_providers(scraper_type: str = 'full') -> List[Dict[str, Any]]:
-    """Scrape TV packages from all enabled providers"""
+def log_changes(records: List[Dict[str, Any]]) -> None:
+    """Append this run's package changes to the NDJSON changelog"""
+    changes_file = Path('../data/tv_changes.ndjson')
+    if not records:
+        return
+    
+    try:
+        append_ndjson(records, changes_file, max_bytes=MAX_CHANGELOG_BYTES)
+        logger.info(f"Logged {len(records)} package changes to {changes_file}")
+    except Exception as e:
+        logger.warning(f"Could not write changelog: {e}")
+
+def load_scraper(provider_config: Dict[str, Any]) -> Callable[[], List[Dict[str, Any]]]:
+    """Import a provider's module and return its scrape function"""
+    module_name = provider_config['module']
+    return getattr(import_module(module_name), f'scrape_{module_name}')
+
+def scrape_tv_providers(scraper_type: str = 'full', previous: List[Dict[str, Any]] = ()) -> List[Dict[str, Any]]:
+    """Scrape TV packages from all enabled providers, keeping previous packages of any that time out"""
     all_packages = []
     successful_providers = 0
     failed_providers = 0
     
     logger.info(f"Starting TV scraping (type: {scraper_type})")
     
-    for provider_config in TV_PROVIDERS:
-        if not provider_config['enabled']:
-            logger.info(f"Skipping disabled provider: {provider_config['name']}")
-            continue
-            
+    # Decide which providers run before dispatching any of them
+    providers_to_run = [p for p in TV_PROVIDERS if p['enabled']]
+    if scraper_type == 'light':
+        # For light scraping, only check a few key providers
+        providers_to_run = [p for p in providers_to_run if p['name'] in LIGHT_TV_PROVIDERS]
+    
+    running = {p['name'] for p in providers_to_run}
+    skipped = [p['name'] for p in TV_PROVIDERS if p['name'] not in running]
+    if skipped:
+        logger.info("Skipping disabled or light-mode providers: %s", ', '.join(skipped))
+    
+    # Import the selected providers up front, on this thread; a module that
+    # fails to import only fails its own provider
+    runnable = []
+    for provider_config in providers_to_run:
+        try:
+            runnable.append({**provider_config, 'scraper': load_scraper(provider_config)})
+        except Exception as e:
+            logger.error(f"✗ {provider_config['name']}: Error - {e}")
+            failed_providers += 1
+    
+    # Every package from this run shares one timestamp
+    scraped_at = datetime.now().isoformat()
+    # package_key of every package collected so far; detect_changes compares
+    # runs on the same identity, so no kept package can shadow another there
+    seen = set()
+    
+    # Providers are network bound, so fetch them concurrently and collect
+    # the results in configuration order
+    for provider_config, future in run_all(runnable):
         provider_name = provider_config['name']
-        scraper_func = provider_config['scraper']
         
         try:
-            logger.info(f"Scraping {provider_name}...")
-            
-            if scraper_type == 'light':
-                # For light scraping, only check a few key providers
-                if provider_name not in ['YouSee', 'Waoo', 'Stofa', 'Boxer', 'Norlys']:
-                    logger.info(f"Skipping {provider_name} in light mode")
-                    continue
-            
-            packages = scraper_func()
+            packages = future.result(timeout=0)
             
             if packages:
-                # Add metadata to each package
+                # Add metadata to each package, keeping the first of any with the same name
+                collected = len(all_packages)
                 for package in packages:
-                    package['scraped_at'] = datetime.now().isoformat()
-                    package['provider'] = provider_name
+                    key = package_key(package)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    package.update(scraped_at=scraped_at, provider=provider_name)
+                    all_packages.append(package)
                 
-                all_packages.extend(packages)
+                kept = len(all_packages) - collected
                 successful_providers += 1
-                logger.info(f"✓ {provider_name}: {len(packages)} packages found")
+                if kept < len(packages):
+                    logger.info(f"✓ {provider_name}: {kept} packages found ({len(packages) - kept} duplicates dropped)")
+                else:
+                    logger.info(f"✓ {provider_name}: {kept} packages found")
             else:
                 logger.warning(f"⚠ {provider_name}: No packages found")
                 failed_providers += 1
                 
+        except (CancelledError, FutureTimeoutError):
+            # Rather than report them all as removed, carry the last run's packages over
+            kept = [package for package in previous if package.get('provider', package.get('udbyder')) == provider_name]
+            for package in kept:
+                seen.add(package_key(package))
+            all_packages.extend(kept)
+            logger.error("✗ %s: timed out after %ss, keeping %d packages from the previous run", provider_name, BATCH_TIMEOUT, len(kept))
+            failed_providers += 1
+            
         except Exception as e:
             logger.error(f"✗ {provider_name}: Error - {e}")
             failed_providers += 1
@@ -196,8 +237,13 @@ def scrape_tv_providers(scraper_type: str = 'full') -> List[Dict[str, Any]]:
     
     return all_packages
 
-def detect_changes(old_data: List[Dict[str, Any]], new_data: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Detect changes between old and new data"""
+def package_key(package: Dict[str, Any]) -> tuple:
+    """Identity of a package when comparing runs"""
+    # Price is compared, not part of the identity, so a price change counts as an update
+    return (package.get('udbyder', ''), package.get('pakke_navn', ''))
+
+def detect_changes(old_data: List[Dict[str, Any]], new_data: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Detect changes between old and new data, with a changelog record per changed package"""
     changes = {
         'new_packages': 0,
         'updated_packages': 0,
@@ -205,38 +251,42 @@ def detect_changes(old_data: List[Dict[str, Any]], new_data: List[Dict[str, Any]
         'price_changes': 0,
         'promotion_changes': 0
     }
+    records = []
     
-    # Create lookup dictionaries
-    old_lookup = {f"{pkg.get('udbyder', '')}-{pkg.get('pakke_navn', '')}-{pkg.get('pris_mdr', '')}": pkg for pkg in old_data}
-    new_lookup = {f"{pkg.get('udbyder', '')}-{pkg.get('pakke_navn', '')}-{pkg.get('pris_mdr', '')}": pkg for pkg in new_data}
+    # Create lookup dictionaries keyed on (provider, package name) tuples
+    old_lookup = {package_key(pkg): pkg for pkg in old_data}
+    new_lookup = {package_key(pkg): pkg for pkg in new_data}
     
-    # Find new packages
-    for key, package in new_lookup.items():
-        if key not in old_lookup:
+    # Find new and updated packages; the counts and the changelog come from the same pass
+    for key, new_package in new_lookup.items():
+        old_package = old_lookup.get(key)
+        if old_package is None:
             changes['new_packages'] += 1
+            records.append({'change': 'new', **new_package})
+            continue
+        
+        # Check for price and promotion changes
+        price_changed = old_package.get('pris_mdr') != new_package.get('pris_mdr')
+        promotion_changed = old_package.get('kampagne') != new_package.get('kampagne')
+        changes['price_changes'] += price_changed
+        changes['promotion_changes'] += promotion_changed
+        
+        if price_changed or promotion_changed:
+            changes['updated_packages'] += 1
+            records.append({
+                'change': 'updated',
+                'old_pris_mdr': old_package.get('pris_mdr'),
+                'old_kampagne': old_package.get('kampagne'),
+                **new_package
+            })
     
     # Find removed packages
-    for key, package in old_lookup.items():
+    for key, old_package in old_lookup.items():
         if key not in new_lookup:
             changes['removed_packages'] += 1
+            records.append({'change': 'removed', **old_package})
     
-    # Find updated packages
-    for key, new_package in new_lookup.items():
-        if key in old_lookup:
-            old_package = old_lookup[key]
-            
-            # Check for price changes
-            if old_package.get('pris_mdr') != new_package.get('pris_mdr'):
-                changes['price_changes'] += 1
-                changes['updated_packages'] += 1
-            
-            # Check for promotion changes
-            if old_package.get('kampagne') != new_package.get('kampagne'):
-                changes['promotion_changes'] += 1
-                if changes['updated_packages'] == 0:  # Don't double count
-                    changes['updated_packages'] += 1
-    
-    return changes
+    return changes, records
 
 def main():
     """Main scraping function"""
@@ -250,20 +300,24 @@ def main():
     logger.info(f"Loaded {len(existing_data)} existing TV packages")
     
     # Scrape new data
-    new_data = scrape_tv_providers(scraper_type)
+    new_data = scrape_tv_providers(scraper_type, existing_data)
     
     if not new_data:
         logger.error("No data scraped. Exiting.")
         return
     
     # Detect changes
-    changes = detect_changes(existing_data, new_data)
+    changes, records = detect_changes(existing_data, new_data)
     logger.info(f"Changes detected: {changes}")
     
+    # Price and promotion changes are already counted in updated_packages
+    has_changes = bool(changes['new_packages'] or changes['updated_packages'] or changes['removed_packages'])
+    
     # Save data if there are changes or force update is enabled
-    if any(changes.values()) or force_update:
+    if has_changes or force_update:
         save_data(new_data)
         logger.info("Data saved successfully")
+        log_changes(records)
         
         # Log summary
         logger.info("=== TV SCRAPING SUMMARY ===")
@@ -7,6 +7,7 @@ import sys
 import os
 import json
 from datetime import datetime
+from importlib import import_module
 
 # Add providers directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'providers'))
@@ -36,7 +37,7 @@ def test_provider_scrapers():
     
     for module_name, provider_name in providers:
         try:
-            module = __import__(module_name)
+            module = import_module(module_name)
             scraper_func = getattr(module, f'scrape_{module_name}')
             
             print(f"Testing {provider_name}...")
@@ -65,8 +66,9 @@ def test_data_validation():
     print("\n🔍 Testing data validation...")
     
     # Test speed normalization
-    from scrape_fiber import TelecomComparison
-    scraper = TelecomComparison()
+    # The normalizers are module-level functions with precompiled patterns,
+    # so the module itself serves every check below
+    import scrape_fiber as scraper
     
     test_cases = [
         ("100 Mbit/s", 100),
@@ -107,6 +109,105 @@ def test_data_validation():
         status = "✅" if result == expected else "❌"
         print(f"  {status} Contract: '{input_text}' -> {result} (expected {expected})")
 
+# A plan card whose numbers and units sit in separate elements, next to
+# complete "Fiber 1000 Mbit/s" and "299 kr/md" text nodes
+SPLIT_NODE_PAGE = """<html><body>
+<div class="plan-card"><h3 class="plan-title">Fiber 1000</h3>
+<strong>1000</strong><span>Mbit/s</span><p>Fiber 1000 Mbit/s</p>
+<p>299 kr/md</p><p>12</p><p>mdr</p></div>
+</body></html>""".encode('utf-8')
+
+def _scrape_page(module_name, fetch_module_name, html):
+    """Run a provider scraper against a fixed page instead of the live site"""
+    # Patch the iter_page the scraper's fetch helper streams through; the
+    # page arrives in small chunks so streaming parsers see split input
+    fetch_module = import_module(fetch_module_name)
+    original_iter = fetch_module.iter_page
+    fetch_module.iter_page = lambda url, timeout=None: (html[i:i + 64] for i in range(0, len(html), 64))
+    try:
+        return getattr(import_module(module_name), f'scrape_{module_name}')()
+    finally:
+        fetch_module.iter_page = original_iter
+
+def test_split_node_fields():
+    """Test that numbers and units in separate elements don't combine into a field"""
+    print("\n🧩 Testing split-node card fields...")
+    
+    # Hiper reads contract length only from a single text node, so the
+    # separate "12" / "mdr" nodes leave it at 0
+    expected = {'hastighed_mbit': 1000, 'pris_mdr': 299, 'bindingstid_mdr': 0}
+    
+    try:
+        plans = _scrape_page('hiper', '_http', SPLIT_NODE_PAGE)
+        result = {key: plans[0][key] for key in expected} if plans else {}
+        status = "✅" if result == expected else "❌"
+        print(f"  {status} Hiper: {result} (expected {expected})")
+    except Exception as e:
+        print(f"  ❌ Hiper split-node test failed: {e}")
+    
+    # The generic fiber scrapers fall back to their 12-month default when no
+    # single text node states the contract length
+    expected = {'hastighed_mbit': 1000, 'pris_mdr': 299, 'bindingstid_mdr': 12}
+    
+    for module_name in ('stofa', 'yousee'):
+        try:
+            plans = _scrape_page(module_name, '_html', SPLIT_NODE_PAGE)
+            result = {key: plans[0][key] for key in expected} if plans else {}
+            status = "✅" if result == expected else "❌"
+            print(f"  {status} {module_name}: {result} (expected {expected})")
+        except Exception as e:
+            print(f"  ❌ {module_name} split-node test failed: {e}")
+
+def test_tv_change_detection():
+    """Test TV change counts and changelog records against a previous run"""
+    print("\n📺 Testing TV change detection...")
+    
+    from scrape_tv import detect_changes
+    
+    old_data = [
+        {'udbyder': 'YouSee', 'pakke_navn': 'Basis', 'pris_mdr': 299, 'kampagne': ''},
+        {'udbyder': 'YouSee', 'pakke_navn': 'Sport', 'pris_mdr': 499, 'kampagne': ''},
+        {'udbyder': 'Stofa', 'pakke_navn': 'Mellem', 'pris_mdr': 379, 'kampagne': ''},
+        {'udbyder': 'Waoo', 'pakke_navn': 'Favorit', 'pris_mdr': 429, 'kampagne': ''}
+    ]
+    # Basis is unchanged, Sport changes price, Mellem gains a promotion,
+    # Favorit disappears and Boxer's Lille is new
+    new_data = [
+        {'udbyder': 'YouSee', 'pakke_navn': 'Basis', 'pris_mdr': 299, 'kampagne': ''},
+        {'udbyder': 'YouSee', 'pakke_navn': 'Sport', 'pris_mdr': 549, 'kampagne': ''},
+        {'udbyder': 'Stofa', 'pakke_navn': 'Mellem', 'pris_mdr': 379, 'kampagne': 'Gratis oprettelse'},
+        {'udbyder': 'Boxer', 'pakke_navn': 'Lille', 'pris_mdr': 199, 'kampagne': ''}
+    ]
+    
+    expected_changes = {
+        'new_packages': 1,
+        'updated_packages': 2,
+        'removed_packages': 1,
+        'price_changes': 1,
+        'promotion_changes': 1
+    }
+    expected_records = [
+        ('updated', 'YouSee', 'Sport', 549, 499, ''),
+        ('updated', 'Stofa', 'Mellem', 379, 379, ''),
+        ('new', 'Boxer', 'Lille', 199, None, None),
+        ('removed', 'Waoo', 'Favorit', 429, None, None)
+    ]
+    
+    try:
+        changes, records = detect_changes(old_data, new_data)
+        
+        status = "✅" if changes == expected_changes else "❌"
+        print(f"  {status} Counts: {changes} (expected {expected_changes})")
+        
+        result = [
+            (r['change'], r['udbyder'], r['pakke_navn'], r['pris_mdr'], r.get('old_pris_mdr'), r.get('old_kampagne'))
+            for r in records
+        ]
+        status = "✅" if result == expected_records else "❌"
+        print(f"  {status} Records: {result} (expected {expected_records})")
+    except Exception as e:
+        print(f"  ❌ TV change detection test failed: {e}")
+
 def test_json_output():
     """Test JSON output format"""
     print("\n📄 Testing JSON output...")
@@ -162,6 +263,12 @@ def main():
     # Test data validation
     test_data_validation()
     
+    # Test card fields split across elements
+    test_split_node_fields()
+    
+    # Test TV change counts and changelog records
+    test_tv_change_detection()
+    
     # Test JSON output
     test_json_output()
     